@@ -1,10 +1,157 @@
-from datetime import datetime, timedelta  # pylint: disable=unused-import
+from collections import namedtuple
+from datetime import datetime, timedelta
+import functools
+import itertools
+import operator
 import django_tables2 as tables
 from django.utils.safestring import mark_safe
-from django.utils.html import escape
 from django.db.models import Q
 from django.conf import settings
 
+_TableMeta = namedtuple("_TableMeta", ["fields_by_name", "search", "times", "discrete"])
+
+
+@functools.lru_cache(maxsize=None)
+def _table_meta(table_class, model):
+    """
+    Compute everything get_table_data needs from the table Meta and the
+    model fields which does not depend on the request.
+    """
+    fields_by_name = {}
+    if model is not None:
+        fields_by_name = {f.name: f for f in model._meta.get_fields()}
+    queries = getattr(table_class.Meta, "queries", None)
+    times_meta = getattr(table_class.Meta, "times", None)
+    searches = getattr(table_class.Meta, "searches", None)
+    search = []
+    times = []
+    discrete = []
+    if queries is not None:
+        search.extend(queries.values())
+        search.sort()
+    if times_meta is not None:
+        for key, value in times_meta.items():
+            field = fields_by_name.get(key)
+            column = table_class.base_columns.get(key)
+            if (
+                column
+                and hasattr(column, "verbose_name")
+                and column.verbose_name is not None
+            ):
+                times.append("%s (%s)" % (str(column.verbose_name), value))
+            elif (
+                field
+                and hasattr(field, "verbose_name")
+                and field.verbose_name is not None
+            ):
+                times.append("%s (%s)" % (str(field.verbose_name), value))
+            else:
+                times.append("%s (%s)" % (key, value))
+        times.sort()
+    if searches is not None:
+        for key in searches.keys():
+            field = fields_by_name.get(key)
+            column = table_class.base_columns.get(key)
+            if (
+                column
+                and hasattr(column, "verbose_name")
+                and column.verbose_name is not None
+            ):
+                search.append(column.verbose_name)
+            elif field and hasattr(field, "verbose_name"):
+                search.append(field.verbose_name)
+            else:
+                search.append(field)
+            discrete.append(key)
+        search = sorted(search, key=lambda s: s.lower())
+    if queries is not None:
+        discrete.extend(queries.values())  # for __and__ queries
+        discrete = sorted(discrete, key=lambda s: s.lower())
+
+    return _TableMeta(fields_by_name, tuple(search), tuple(times), tuple(discrete))
+
+
+@functools.lru_cache(maxsize=None)
+def _build_filter_plan(table_class):
+    """
+    Precompute the request keys and lookups of the table Meta and return
+    a callable building the Q object and the search terms for a view.
+    The request keys are prefixed when the plan runs: prefixes can be built
+    from database ids and must not grow the cache.
+    """
+    searches = getattr(table_class.Meta, "searches", {})
+    queries = getattr(table_class.Meta, "queries", {})
+    times = getattr(table_class.Meta, "times", {})
+
+    # (unprefixed request key, lookup) for __and__ searches on simple fields
+    discrete_terms = [(key, "%s__contains" % key) for key in searches]
+    # (unprefixed request key, handler) for __and__ searches on relational fields
+    query_terms = [(argument, func) for func, argument in queries.items()]
+    # lookups for the general __or__ search
+    search_terms = ["%s__%s" % (key, lookup) for key, lookup in searches.items()]
+    time_terms = list(times.items())
+
+    def plan(view, prefix):
+        request_get = view.request.GET
+        prefix = prefix or ""
+        table_search = "%ssearch" % prefix
+        terms = {}
+        # discrete searches
+        query = functools.reduce(
+            operator.and_,
+            (
+                Q(**{lookup: request_get.get(prefix + request_key)})
+                for request_key, lookup in discrete_terms
+                if request_get.get(prefix + request_key)
+            ),
+            Q(),
+        )
+        # note that this calls the function 'func' with the argument from the search
+        query = functools.reduce(
+            operator.and_,
+            (
+                getattr(view, func)(request_get.get(prefix + request_key))
+                for request_key, func in query_terms
+                if request_get.get(prefix + request_key)
+            ),
+            query,
+        )
+        # general OR searches
+        if request_get.get(table_search):
+            terms["search"] = request_get.get(table_search)
+        if searches and "search" in terms:
+            term = terms["search"]
+            # this is a little bit of magic - creates an OR clause in the query based
+            # on the iterable search hash passed in via the table_class
+            # e.g. self.searches = {'id', 'contains'}
+            # so every simple search column in the table is queried at the same time with OR
+            # The explicit handlers are called as simple text searches of relational fields.
+            query = functools.reduce(
+                operator.or_,
+                itertools.chain(
+                    (Q(**{lookup: term}) for lookup in search_terms),
+                    (getattr(view, func)(term) for _, func in query_terms),
+                ),
+                query,
+            )
+        # now add "class specials" - from an iterable hash
+        # datetime uses (start_time__lte=datetime.now()-timedelta(days=3)
+        for key, value in time_terms:
+            match = request_get.get(key)
+            if not match:
+                continue
+            # the label for this query in the search list
+            terms[key] = "%s within %s %s" % (key, match, value)
+            try:
+                since = datetime.now() - timedelta(**{value: int(match)})
+            except (ValueError, OverflowError):
+                # should log the exception somewhere...
+                continue  # just skip this term - results in a query matching All.
+            query &= Q(**{"%s__gte" % key: since})
+        return query, terms
+
+    return plan
+
 
 class LavaView(tables.SingleTableView):
     def __init__(self, request, **kwargs):
@@ -12,44 +159,9 @@ class LavaView(tables.SingleTableView):
         self.request = request
         self.terms = {}  # complete search term list, passed back to the template.
         self.search = []
-        self.queries = []
         self.times = []
         self.discrete = []
 
-    def _time_filter(self, query):
-        """
-        bespoke time-based field handling
-        """
-        local_namespace = locals()
-        local_namespace["q"] = query
-        time_queries = {}
-        if hasattr(self.table_class.Meta, "times"):
-            # filter the possible list by the request
-            for key, value in self.table_class.Meta.times.items():
-                # check if the request includes the current time filter & get the value
-                match = self.request.GET.get(key)
-                if match and match != "":
-                    self.terms[key] = "%s within %s %s" % (
-                        key,
-                        match,
-                        value,
-                    )  # the label for this query in the search list
-                    time_queries[key] = value
-            for key, value in time_queries.items():
-                match = escape(self.request.GET.get(key))
-                # escape converts None into u'None'
-                if not match or match == "" or match == "None":
-                    continue
-                args = "q = q.__and__(Q({0}__gte=datetime.now()-timedelta({1}={2})))".format(
-                    key, value, match
-                )
-                try:
-                    exec(args, globals(), local_namespace)  # sets the value of q
-                except SyntaxError:
-                    # should log the exception somewhere...
-                    continue  # just skip this term - results in a query matching All.
-        return local_namespace["q"]
-
     def get_table_data(self, prefix=None):
         """
         Takes the table data and adds filters based on the content of the request
@@ -61,122 +173,26 @@ class LavaView(tables.SingleTableView):
           times - fields which can be searched by a duration
         :return: filtered data
         """
-        distinct = {}
         data = self.get_queryset()
         if not self.table_class or not hasattr(self.table_class, "Meta"):
             return data
-        if prefix:
-            table_search = "%ssearch" % prefix
-        else:
-            table_search = "search"
-        if hasattr(self.table_class.Meta, "queries"):
-            self.search.extend(self.table_class.Meta.queries.values())
-            self.search.sort()
-        if hasattr(self.table_class.Meta, "times"):
-            for key, value in self.table_class.Meta.times.items():
-                field = next(
-                    (f for f in self.model._meta.get_fields() if f.name == key)
-                )
-                column = self.table_class.base_columns.get(key)
-                if (
-                    column
-                    and hasattr(column, "verbose_name")
-                    and column.verbose_name is not None
-                ):
-                    self.times.append("%s (%s)" % (str(column.verbose_name), value))
-                elif (
-                    field
-                    and hasattr(field, "verbose_name")
-                    and field.verbose_name is not None
-                ):
-                    self.times.append("%s (%s)" % (str(field.verbose_name), value))
-                else:
-                    self.times.append("%s (%s)" % (key, value))
-            self.times.sort()
-        if hasattr(self.table_class.Meta, "searches"):
-            for key in self.table_class.Meta.searches.keys():
-                field = next(
-                    (f for f in self.model._meta.get_fields() if f.name == key)
-                )
-                column = self.table_class.base_columns.get(key)
-                if (
-                    column
-                    and hasattr(column, "verbose_name")
-                    and column.verbose_name is not None
-                ):
-                    self.search.append(column.verbose_name)
-                elif field and hasattr(field, "verbose_name"):
-                    self.search.append(field.verbose_name)
-                else:
-                    self.search.append(field)
-                discrete_key = "%s%s" % (prefix, key) if prefix else key
-                self.discrete.append(discrete_key)
-                if self.request and self.request.GET.get(discrete_key):
-                    distinct[discrete_key] = escape(self.request.GET.get(discrete_key))
-            self.search = sorted(self.search, key=lambda s: s.lower())
-        if hasattr(self.table_class.Meta, "queries"):
-            for func, argument in self.table_class.Meta.queries.items():
-                request_argument = "%s%s" % (prefix, argument) if prefix else argument
-                self.discrete.append(request_argument)  # for __and__ queries
-                if self.request and self.request.GET.get(request_argument):
-                    distinct[func] = escape(self.request.GET.get(request_argument))
-            self.discrete = sorted(self.discrete, key=lambda s: s.lower())
+        meta_info = _table_meta(self.table_class, self.model)
+        self.search = list(meta_info.search)
+        self.times = list(meta_info.times)
+        # a common prefix does not change the sort order
+        self.discrete = [
+            "%s%s" % (prefix, key) if prefix else key for key in meta_info.discrete
+        ]
         if not self.request:
             return data
 
-        local_namespace = locals()
-        local_namespace["q"] = Q()
-        self.terms = {}
-        # discrete searches
-        for key, val in distinct.items():
-            if key in self.table_class.Meta.searches:
-                args = 'q = q.__and__(Q({0}__contains="{1}"))'.format(key, val)
-                try:
-                    exec(args, globals(), local_namespace)  # sets the value of q
-                except SyntaxError:
-                    # should log exception somewhere...
-                    continue  # just skip this term - results in a query matching All.
-            if (
-                hasattr(self.table_class.Meta, "queries")
-                and key in self.table_class.Meta.queries.keys()
-            ):
-                # note that this calls the function 'key' with the argument from the search
-                args = 'q = q.__and__(self.{0}("{1}"))'.format(key, val)
-                try:
-                    exec(args, globals(), local_namespace)
-                except SyntaxError:
-                    # should log exception somewhere...
-                    continue
-        # general OR searches
-        if self.request.GET.get(table_search):
-            self.terms["search"] = escape(self.request.GET.get(table_search))
-        if hasattr(self.table_class.Meta, "searches") and "search" in self.terms:
-            for key, val in self.table_class.Meta.searches.items():
-                # this is a little bit of magic - creates an OR clause in the query based
-                # on the iterable search hash passed in via the table_class
-                # e.g. self.searches = {'id', 'contains'}
-                # so every simple search column in the table is queried at the same time with OR
-                args = 'q = q.__or__(Q({0}__{1}=self.terms["search"]))'.format(key, val)
-                try:
-                    exec(args, globals(), local_namespace)  # sets the value of q
-                except SyntaxError:
-                    # should log exception somewhere...
-                    continue  # just skip this term - results in a query matching All.
-            # call explicit handlers as simple text searches of relational fields.
-            if hasattr(self.table_class.Meta, "queries"):
-                for key in self.table_class.Meta.queries:
-                    # note that this calls the function 'key' with the argument from the search
-                    args = 'q = q.__or__(self.{0}("{1}"))'.format(
-                        key, self.terms["search"].encode("utf-8")
-                    )
-                    try:
-                        exec(args, globals(), local_namespace)
-                    except SyntaxError:
-                        # should log exception somewhere...
-                        continue
-        # now add "class specials" - from an iterable hash
-        # datetime uses (start_time__lte=datetime.now()-timedelta(days=3)
-        data = data.filter(self._time_filter(local_namespace["q"]))
+        plan = _build_filter_plan(self.table_class)
+        query, self.terms = plan(self, prefix)
+        data = data.filter(query)
+        # Tables are paginated with LIMIT/OFFSET: without an ORDER BY, the
+        # database is free to return the rows of each page in any order.
+        if not data.ordered and data.query.group_by is None:
+            data = data.order_by("pk")
         return data
 
 
@@ -40,52 +40,62 @@ from voluptuous import (
 from lava_common.timeout import Timeout
 
 
-CONTEXT_VARIABLES = [
-    # qemu variables
-    "arch",
-    "boot_console",
-    "boot_root",
-    "cpu",
-    "extra_options",
-    "guestfs_driveid",
-    "guestfs_interface",
-    "guestfs_size",
-    "machine",
-    "memory",
-    "model",
-    "monitor",
-    "netdevice",
-    "serial",
-    "vga",
-    # others
-    "bootloader_prompt",
-    "console_device",
-    "extra_kernel_args",
-    "extra_nfsroot_args",
-    "kernel_loglevel",
-    "kernel_start_message",
-    "lava_test_results_dir",
-    "menu_interrupt_prompt",
-    "mustang_menu_list",
-    "test_character_delay",
-    "tftp_mac_address",
-    "uboot_extra_error_message",
-    "uboot_needs_interrupt",
-]
+CONTEXT_VARIABLES = frozenset(
+    [
+        # qemu variables
+        "arch",
+        "boot_console",
+        "boot_root",
+        "cpu",
+        "extra_options",
+        "guestfs_driveid",
+        "guestfs_interface",
+        "guestfs_size",
+        "machine",
+        "memory",
+        "model",
+        "monitor",
+        "netdevice",
+        "serial",
+        "vga",
+        # others
+        "bootloader_prompt",
+        "console_device",
+        "extra_kernel_args",
+        "extra_nfsroot_args",
+        "kernel_loglevel",
+        "kernel_start_message",
+        "lava_test_results_dir",
+        "menu_interrupt_prompt",
+        "mustang_menu_list",
+        "test_character_delay",
+        "tftp_mac_address",
+        "uboot_extra_error_message",
+        "uboot_needs_interrupt",
+    ]
+)
+
+
+# Compiled action schemas, indexed by (action name, strict)
+_ACTION_SCHEMAS = {}
 
 
 def validate_action(name, data, strict=True):
-    # Import the module
+    # Import the module and compile the schema, only once
     try:
-        module = importlib.import_module("lava_common.schemas." + name)
-        Schema(module.schema(), extra=not strict)(data)
+        schema = _ACTION_SCHEMAS.get((name, strict))
+        if schema is None:
+            module = importlib.import_module("lava_common.schemas." + name)
+            schema = Schema(module.schema(), extra=not strict)
+            _ACTION_SCHEMAS[(name, strict)] = schema
+        schema(data)
     except ImportError:
         raise Invalid("unknown action type", path=["actions"] + name.split("."))
     except MultipleInvalid as exc:
         raise Invalid(exc.msg, path=["actions"] + name.split(".")) from exc
 
 
-def validate(data, strict=True, extra_context_variables=[]):
+def validate(data, strict=True, extra_context_variables=None):
     schema = Schema(job(extra_context_variables), extra=not strict)
     schema(data)
     for action in data["actions"]:
@@ -260,8 +270,10 @@ def check_secrets_visibility(data):
         raise Invalid('When using "secrets", visibility shouldn\'t be "public"')
 
 
-def job(extra_context_variables=[]):
-    context_variables = CONTEXT_VARIABLES + extra_context_variables
+def job(extra_context_variables=None):
+    if extra_context_variables is None:
+        extra_context_variables = []
+    context_variables = CONTEXT_VARIABLES.union(extra_context_variables)
     lava_lxc = {
         Required("name"): str,
         Required("distribution"): str,
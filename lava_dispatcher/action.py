@@ -249,8 +249,8 @@ class Pipeline:  # pylint: disable=too-many-instance-attributes
                 if action.timeout.can_skip(action.parameters):
                     if self.parent is None:
                         action.logger.warning(
-                            "skip_timeout is set for %s - continuing to next action block."
-                            % (action.name)
+                            "skip_timeout is set for %s - continuing to next action block.",
+                            action.name,
                         )
                     else:
                         raise
@@ -533,8 +533,8 @@ class Action:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 self.results = {"returncode": "0"}
                 self.results = {"output_len": len(log)}
                 self.logger.info(
-                    "Parsed command exited zero with allow_fail set, returning %s bytes."
-                    % len(log)
+                    "Parsed command exited zero with allow_fail set, returning %s bytes.",
+                    len(log),
                 )
         except subprocess.CalledProcessError as exc:
             # the errors property doesn't support removing errors
@@ -546,7 +546,7 @@ class Action:  # pylint: disable=too-many-instance-attributes,too-many-public-me
                 output = str(exc)
             errors.append(output)
             self.results = {"returncode": "%s" % exc.returncode}
-            self.logger.info("Parsed command exited %s." % retcode)
+            self.logger.info("Parsed command exited %s.", retcode)
             base = (
                 "action: {0}\ncommand: {1}\nmessage: {2}\noutput: {3}\nreturn code: {4}"
             )
@@ -204,6 +204,9 @@ class BootGDBRetry(RetryAction):
     def cleanup(self, connection):
         if self.gdb_connection is None:
             return
+        # The connection is already finalised when cleanup is called again
+        if self.gdb_connection.raw_connection is None:
+            return
         if self.gdb_connection.raw_connection.isalive():
             self.logger.info("Stopping gdb cleanly")
             try:
@@ -290,7 +290,7 @@ class DownloadHandler(Action):  # pylint: disable=too-many-instance-attributes
             progress = progress_unknown_total
         else:
             self.logger.debug(
-                "total size: %d (%dMB)" % (self.size, int(self.size / (1024 * 1024)))
+                "total size: %d (%dMB)", self.size, int(self.size / (1024 * 1024))
             )
             last_value = -5
             progress = progress_known_total
@@ -355,12 +355,10 @@ class DownloadHandler(Action):  # pylint: disable=too-many-instance-attributes
         # Log the download speed
         ending = time.time()
         self.logger.info(
-            "%dMB downloaded in %0.2fs (%0.2fMB/s)"
-            % (
-                downloaded_size / (1024 * 1024),
-                round(ending - beginning, 2),
-                round(downloaded_size / (1024 * 1024 * (ending - beginning)), 2),
-            )
+            "%dMB downloaded in %0.2fs (%0.2fMB/s)",
+            downloaded_size / (1024 * 1024),
+            round(ending - beginning, 2),
+            round(downloaded_size / (1024 * 1024 * (ending - beginning)), 2),
         )
 
         # If the remote server uses "Content-Encoding: gzip", this calculation will be wrong
@@ -413,21 +411,19 @@ class DownloadHandler(Action):  # pylint: disable=too-many-instance-attributes
                     key=self.key,
                     value=target_fname,
                 )
-            self.logger.debug("Using %s archive" % archive)
+            self.logger.debug("Using %s archive", archive)
 
         if md5sum is not None:
             chk_md5sum = self.get_namespace_data(
                 action="download-action", label=self.key, key="md5"
             )
             if md5sum != chk_md5sum:
-                self.logger.error("md5sum of downloaded content: %s" % chk_md5sum)
+                self.logger.error("md5sum of downloaded content: %s", chk_md5sum)
                 self.logger.info(
-                    "sha256sum of downloaded content: %s"
-                    % (
-                        self.get_namespace_data(
-                            action="download-action", label=self.key, key="sha256"
-                        )
-                    )
+                    "sha256sum of downloaded content: %s",
+                    self.get_namespace_data(
+                        action="download-action", label=self.key, key="sha256"
+                    ),
                 )
                 self.results = {"fail": {"md5": md5sum, "download": chk_md5sum}}
                 raise JobError("MD5 checksum for '%s' does not match." % fname)
@@ -439,14 +435,12 @@ class DownloadHandler(Action):  # pylint: disable=too-many-instance-attributes
             )
             if sha256sum != chk_sha256sum:
                 self.logger.info(
-                    "md5sum of downloaded content: %s"
-                    % (
-                        self.get_namespace_data(
-                            action="download-action", label=self.key, key="md5"
-                        )
-                    )
+                    "md5sum of downloaded content: %s",
+                    self.get_namespace_data(
+                        action="download-action", label=self.key, key="md5"
+                    ),
                 )
-                self.logger.error("sha256sum of downloaded content: %s" % chk_sha256sum)
+                self.logger.error("sha256sum of downloaded content: %s", chk_sha256sum)
                 self.results = {
                     "fail": {"sha256": sha256sum, "download": chk_sha256sum}
                 }
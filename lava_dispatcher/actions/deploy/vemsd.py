@@ -363,7 +363,7 @@ class DeployVExpressRecoveryImage(Action):
         )
         try:
             remove_directory_contents(mount_point)
-        except Exception:
+        except OSError:
             raise JobError("Failed to erase old recovery image")
 
         self.logger.debug(
@@ -371,7 +371,7 @@ class DeployVExpressRecoveryImage(Action):
         )
         try:
             copy_directory_contents(src_dir, mount_point)
-        except Exception:
+        except OSError:
             raise JobError("Failed to deploy recovery image to %s" % mount_point)
         return connection
 
@@ -278,7 +278,7 @@ class TestShellAction(TestAction):
                 "otherwise this is a bug which should be reported."
             )
 
-        self.logger.debug("Using %s" % lava_test_results_dir)
+        self.logger.debug("Using %s", lava_test_results_dir)
         if lava_test_sh_cmd:
             connection.sendline(
                 "export SHELL=%s" % lava_test_sh_cmd, delay=self.character_delay
@@ -394,9 +394,9 @@ class TestShellAction(TestAction):
                 fixup = pattern_dict["testdef_pattern"]["fixupdict"]
                 self.patterns.update({"test_case_result": re.compile(pattern, re.M)})
                 self.pattern.update(pattern, fixup)
-                self.logger.info("Enabling test definition pattern %r" % pattern)
+                self.logger.info("Enabling test definition pattern %r", pattern)
                 self.logger.info(
-                    "Enabling test definition fixup %r" % self.pattern.fixup
+                    "Enabling test definition fixup %r", self.pattern.fixup
                 )
         self.current_run = {
             "definition": "lava",
@@ -570,7 +570,7 @@ class TestShellAction(TestAction):
         res = self.signal_match.match(
             match.groupdict(), fixupdict=self.pattern.fixupdict()
         )
-        self.logger.debug("outer_loop_result: %s" % res)
+        self.logger.debug("outer_loop_result: %s", res)
         return True
 
     @nottest
@@ -634,7 +634,7 @@ class TestShellAction(TestAction):
 
         elif event == "signal":
             name, params = test_connection.match.groups()
-            self.logger.debug("Received signal: <%s> %s" % (name, params))
+            self.logger.debug("Received signal: <%s> %s", name, params)
             params = params.split()
             if name == "STARTRUN":
                 self.signal_start_run(params)
@@ -677,7 +677,7 @@ class TestShellAction(TestAction):
     def _keep_running(self, test_connection, timeout, check_char):
         if "test_case_results" in self.patterns:
             self.logger.info(
-                "Test case result pattern: %r" % self.patterns["test_case_results"]
+                "Test case result pattern: %r", self.patterns["test_case_results"]
             )
         retval = test_connection.expect(list(self.patterns.values()), timeout=timeout)
         return self.check_patterns(
@@ -36,21 +36,33 @@ class ShellLogger:
     """
     Builds a YAML log message out of the incremental output of the pexpect.spawn
     using the logfile support built into pexpect.
+
+    A partial line is kept in memory until the next newline. Once it grows
+    beyond max_length characters, it is logged as is, so that a console
+    which never prints a newline cannot grow the buffer without bounds.
     """
 
-    def __init__(self, logger):
+    REPLACEMENTS = (
+        ("\n\n", "\n"),  # double lines to single
+        ("\r", ""),
+        ('"', '\\"'),  # escape double quotes for YAML syntax
+        ("\x1b", ""),  # remove escape control characters
+    )
+
+    def __init__(self, logger, max_length=1 << 16):
         self.line = ""
         self.logger = logger
         self.is_feedback = False
+        self.max_length = max_length
+
+    def _log(self, line):
+        if self.is_feedback:
+            self.logger.feedback(line)
+        else:
+            self.logger.target(line)
 
     def write(self, new_line):
-        replacements = {
-            "\n\n": "\n",  # double lines to single
-            "\r": "",
-            '"': '\\"',  # escape double quotes for YAML syntax
-            "\x1b": "",  # remove escape control characters
-        }
-        for key, value in replacements.items():
+        for key, value in self.REPLACEMENTS:
             new_line = new_line.replace(key, value)
         lines = self.line + new_line
 
@@ -60,12 +72,12 @@ class ShellLogger:
             self.line = lines[last_ret + 1 :]
             lines = lines[:last_ret]
             for line in lines.split("\n"):
-                if self.is_feedback:
-                    self.logger.feedback(line)
-                else:
-                    self.logger.target(line)
+                self._log(line)
         else:
             self.line = lines
+        if len(self.line) > self.max_length:
+            self._log(self.line)
+            self.line = ""
         return
 
     def flush(self):  # pylint: disable=no-self-use
@@ -243,7 +255,7 @@ class ShellSession(Connection):
         # connection_prompt_limit
         partial_timeout = remaining / 2.0
         logger.debug(
-            "Waiting using forced prompt support. %ss timeout" % partial_timeout
+            "Waiting using forced prompt support. %ss timeout", partial_timeout
         )
         while True:
             try:
@@ -18,9 +18,12 @@
 # along
 # with this program; if not, see <http://www.gnu.org/licenses>.
 
+import logging
 import unittest
 
 from lava_common.exceptions import InfrastructureError, JobError
+from lava_common.timeout import Timeout
+from lava_dispatcher.shell import ShellCommand, ShellSession
 from lava_dispatcher.tests.test_basic import Factory, StdoutTestCase
 from lava_dispatcher.utils.shell import which
 
@@ -135,3 +138,21 @@ class TestGDB(StdoutTestCase):
         self.assertEqual(action.commands[3], "set remotetimeout 10000")
         self.assertEqual(action.container, "ti-openocd")
         self.assertEqual(action.devices, ["/dev/hidraw3"])
+
+    @unittest.skipIf(check_docker(), "docker not available")
+    @unittest.skipIf(check_gdb_multipart(), "gdb-multiarch not available")
+    def test_cleanup_finalised_connection(self):
+        factory = GDBFactory()
+        job = factory.create_cc3230SF_job("sample_jobs/cc3220SF.yaml")
+        job.validate()
+        action = job.pipeline.actions[1].internal_pipeline.actions[0]
+        self.assertEqual(action.name, "boot-gdb-retry")
+
+        shell = ShellCommand("ls", Timeout("fake", 30), logger=logging.getLogger())
+        action.gdb_connection = ShellSession(job, shell)
+        action.gdb_connection.finalise()
+        action.gdb_connection.raw_connection = None
+        # Calling cleanup on a finalised connection should do nothing
+        action.cleanup(None)
+        action.cleanup(None)
+        self.assertIsNone(action.gdb_connection.raw_connection)
@@ -33,6 +33,7 @@ from lava_dispatcher.protocols.multinode import MultinodeProtocol
 from lava_dispatcher.protocols.vland import VlandProtocol
 from lava_dispatcher.tests.test_basic import Factory, StdoutTestCase
 from lava_dispatcher.actions.test.shell import TestShellRetry, TestShellAction
+from lava_dispatcher.shell import ShellLogger
 
 
 # pylint: disable=duplicate-code,too-few-public-methods
@@ -185,3 +186,30 @@ class TestShellResults(StdoutTestCase):  # pylint: disable=too-many-public-metho
         def run(self, connection, max_end_time):
             self.count += 1
             raise JobError("fake error")
+
+
+class TestShellLogger(StdoutTestCase):
+    class RecordingLogger(DummyLogger):
+        def __init__(self):
+            self.lines = []
+
+        def target(self, *args, **kwargs):
+            self.lines.append(args[0])
+
+    def test_partial_lines(self):
+        logger = TestShellLogger.RecordingLogger()
+        shell_logger = ShellLogger(logger)
+        shell_logger.write("first\r\nsec")
+        self.assertEqual(logger.lines, ["first"])
+        shell_logger.write('ond "quoted"\n')
+        self.assertEqual(logger.lines, ["first", 'second \\"quoted\\"'])
+        self.assertEqual(shell_logger.line, "")
+
+    def test_max_length(self):
+        logger = TestShellLogger.RecordingLogger()
+        shell_logger = ShellLogger(logger, max_length=8)
+        shell_logger.write("12345")
+        self.assertEqual(logger.lines, [])
+        shell_logger.write("\r67890")
+        self.assertEqual(logger.lines, ["1234567890"])
+        self.assertEqual(shell_logger.line, "")
@@ -36,10 +36,12 @@ from lava_results_app.models import (
 
 class ActionDataAdmin(admin.ModelAdmin):
     list_display = ("job_pk", "action_level", "action_name")
+    list_select_related = ("testdata",)
     ordering = ("-testdata__testjob__pk", "-action_level")
+    raw_id_fields = ("meta_type", "testdata", "testcase")
 
     def job_pk(self, action):
-        return action.testdata.testjob.pk
+        return action.testdata.testjob_id
 
     def has_add_permission(self, request):
         return False
@@ -50,7 +52,9 @@ class ActionDataAdmin(admin.ModelAdmin):
 
 class QueryAdmin(admin.ModelAdmin):
     list_display = ("name", "owner", "query_group", "is_published", "is_archived")
+    list_select_related = ("owner", "query_group")
     ordering = ("name", "owner", "query_group", "is_published", "is_archived")
+    raw_id_fields = ("owner",)
     save_as = True
 
     def has_add_permission(self, request):
@@ -62,10 +66,13 @@ class QueryAdmin(admin.ModelAdmin):
 
 class TestCaseAdmin(admin.ModelAdmin):
     list_display = ("job_pk", "suite_name", "name", "result")
+    list_select_related = ("suite",)
     ordering = ("-suite__job__pk", "suite__name", "name")
+    raw_id_fields = ("suite", "test_set")
+    search_fields = ("name", "suite__name")
 
     def job_pk(self, testcase):
-        return testcase.suite.job.pk
+        return testcase.suite.job_id
 
     def suite_name(self, testcase):
         return testcase.suite.name
@@ -79,6 +86,8 @@ class TestCaseAdmin(admin.ModelAdmin):
 
 class TestSetAdmin(admin.ModelAdmin):
     list_display = ("suite", "name")
+    list_select_related = ("suite__job",)
+    raw_id_fields = ("suite",)
 
     def has_add_permission(self, request):
         return False
@@ -90,9 +99,11 @@ class TestSetAdmin(admin.ModelAdmin):
 class TestSuiteAdmin(admin.ModelAdmin):
     list_display = ("job_pk", "name")
     ordering = ("-job__pk", "name")
+    raw_id_fields = ("job",)
+    search_fields = ("name",)
 
     def job_pk(self, testsuite):
-        return testsuite.job.pk
+        return testsuite.job_id
 
     def has_add_permission(self, request):
         return False
@@ -84,6 +84,10 @@ class DefaultOwnerInline(admin.StackedInline):
     model = DefaultDeviceOwner
     can_delete = False
 
+    def get_queryset(self, request):
+        # The stacked form header renders __str__, which needs the user
+        return super().get_queryset(request).select_related("user")
+
 
 def expire_user_action(
     modeladmin, request, queryset
@@ -338,6 +342,7 @@ class DeviceAdmin(admin.ModelAdmin):
         "is_public",
         "valid_device",
     )
+    list_select_related = ("device_type", "worker_host")
     search_fields = ("hostname", "device_type__name")
     ordering = ["hostname"]
     actions = [
@@ -368,6 +373,14 @@ class VisibilityForm(forms.ModelForm):
 
 
 class TestJobAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        # The job definitions are not displayed: avoid loading them for every row
+        return (
+            super()
+            .get_queryset(request)
+            .defer("definition", "original_definition", "multinode_definition")
+        )
+
     def requested_device_type_name(self, obj):
         return "" if obj.requested_device_type is None else obj.requested_device_type
 
@@ -416,6 +429,9 @@ class TestJobAdmin(admin.ModelAdmin):
         "start_time",
         "end_time",
     )
+    list_select_related = ("submitter", "requested_device_type", "actual_device")
+    raw_id_fields = ["submitter", "user"]
+    search_fields = ("description", "submitter__username")
     ordering = ["-submit_time"]
 
 
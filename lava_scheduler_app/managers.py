@@ -22,11 +22,20 @@ from django.db.models import Q
 
 from django_restricted_resource.managers import RestrictedResourceQuerySet
 
+# lava_scheduler_app.models imports this module: TestJob is resolved on first use
+_TestJob = None
+
+
+def _testjob_model():
+    global _TestJob  # pylint: disable=global-statement
+    if _TestJob is None:
+        from lava_scheduler_app.models import TestJob as _TestJob
+    return _TestJob
+
 
 class RestrictedTestJobQuerySet(RestrictedResourceQuerySet):
     def visible_by_user(self, user):
-
-        from lava_scheduler_app.models import TestJob
+        TestJob = self.model
 
         conditions = Q()
         # Pipeline jobs.
@@ -60,8 +69,7 @@ class RestrictedTestJobQuerySet(RestrictedResourceQuerySet):
 
 class RestrictedTestCaseQuerySet(RestrictedResourceQuerySet):
     def visible_by_user(self, user):
-
-        from lava_scheduler_app.models import TestJob
+        TestJob = _testjob_model()
 
         jobs = TestJob.objects.filter(testsuite__testcase__in=self).visible_by_user(
             user
@@ -72,8 +80,7 @@ class RestrictedTestCaseQuerySet(RestrictedResourceQuerySet):
 
 class RestrictedTestSuiteQuerySet(models.QuerySet):
     def visible_by_user(self, user):
-
-        from lava_scheduler_app.models import TestJob
+        TestJob = _testjob_model()
 
         jobs = TestJob.objects.filter(testsuite__in=self).visible_by_user(user)
 
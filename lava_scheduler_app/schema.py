@@ -106,7 +106,7 @@ def _simple_params():
 
 
 def _context_schema():
-    context_variables = CONTEXT_VARIABLES + settings.EXTRA_CONTEXT_VARIABLES
+    context_variables = CONTEXT_VARIABLES.union(settings.EXTRA_CONTEXT_VARIABLES)
     return Schema({In(context_variables): Any(int, str, [int, str])}, extra=False)
 
 
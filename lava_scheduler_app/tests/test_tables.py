@@ -1,11 +1,15 @@
 import logging
 import sys
+from datetime import datetime, timedelta
 from nose.tools import nottest
 from django.contrib.auth.models import User, AnonymousUser
+from django.db.models import Q
+from django.test import RequestFactory
+from django.utils import timezone
 from django_testscenarios.ubertest import TestCase
 from lava_scheduler_app.models import Device, DeviceType, TestJob
 from lava_scheduler_app.views import filter_device_types
-from lava.utils.lavatable import LavaTable, LavaView
+from lava.utils.lavatable import LavaTable, LavaView, _build_filter_plan
 from lava_scheduler_app.tables import JobTable, DeviceTable, all_jobs_with_custom_sort
 
 LOGGER = logging.getLogger()
@@ -167,6 +171,119 @@ class TestPrefixJobTable(TestCase):
         )
 
 
+@nottest
+class TestSearchTable(LavaTable):
+    class Meta(LavaTable.Meta):  # pylint: disable=too-few-public-methods,no-init
+        model = TestJob
+        searches = {"description": "contains"}
+        queries = {"owner_query": "submitter"}
+        times = {"submit_time": "hours"}
+
+
+@nottest
+class TestSearchView(LavaView):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.owner_terms = []
+
+    def get_queryset(self):
+        return TestJob.objects.all().order_by("id")
+
+    def owner_query(self, term):
+        self.owner_terms.append(term)
+        return Q(submitter__username__contains=term)
+
+
+def lookups(node):
+    """
+    Flatten the where clause of a query into (field, lookup, value) tuples
+    """
+    for child in node.children:
+        if hasattr(child, "children"):
+            yield from lookups(child)
+        else:
+            yield (child.lhs.target.name, child.lookup_name, child.rhs)
+
+
+class TestSearchFilters(TestCase):
+    """
+    Filters built by LavaView.get_table_data from the request
+    """
+
+    def get_view(self, params):
+        request = RequestFactory().get("/", params)
+        return TestSearchView(request, model=TestJob, table_class=TestSearchTable)
+
+    def assertFilter(self, view, data, query):
+        self.assertEqual(str(data.query), str(view.get_queryset().filter(query).query))
+
+    def test_prefix_discrete(self):
+        view = self.get_view(
+            {"abc_description": "foo", "abc_submitter": "bob", "description": "bar"}
+        )
+        data = view.get_table_data("abc_")
+        self.assertFilter(
+            view,
+            data,
+            Q(description__contains="foo") & Q(submitter__username__contains="bob"),
+        )
+        self.assertEqual(view.owner_terms, ["bob"])
+        self.assertEqual(view.terms, {})
+
+    def test_prefix_plan_cache(self):
+        self.get_view({}).get_table_data("group_1_")
+        size = _build_filter_plan.cache_info().currsize
+        for prefix in ["group_2_", "group_3_", None]:
+            self.get_view({}).get_table_data(prefix)
+        self.assertEqual(_build_filter_plan.cache_info().currsize, size)
+
+    def test_general_search(self):
+        view = self.get_view({"search": "foo"})
+        data = view.get_table_data()
+        self.assertFilter(
+            view,
+            data,
+            Q(description__contains="foo") | Q(submitter__username__contains="foo"),
+        )
+        self.assertEqual(view.owner_terms, ["foo"])
+        self.assertEqual(view.terms, {"search": "foo"})
+
+    def test_unescaped_search(self):
+        term = 'a&b "c"'
+        view = self.get_view({"search": term, "abc_description": term})
+        data = view.get_table_data()
+        self.assertIn(
+            ("description", "contains", term), list(lookups(data.query.where))
+        )
+        self.assertEqual(view.owner_terms, [term])
+        self.assertEqual(view.terms, {"search": term})
+
+        data = view.get_table_data("abc_")
+        self.assertEqual(
+            list(lookups(data.query.where)), [("description", "contains", term)]
+        )
+
+    def test_time(self):
+        view = self.get_view({"submit_time": "3"})
+        data = view.get_table_data()
+        self.assertEqual(view.terms, {"submit_time": "submit_time within 3 hours"})
+        ((field, lookup, since),) = lookups(data.query.where)
+        self.assertEqual((field, lookup), ("submit_time", "gte"))
+        if timezone.is_aware(since):
+            since = timezone.make_naive(since)
+        delta = datetime.now() - since
+        self.assertTrue(timedelta(hours=3) <= delta < timedelta(hours=3, minutes=1))
+
+    def test_invalid_time(self):
+        for value in ["three", "99999999999"]:
+            view = self.get_view({"submit_time": value})
+            data = view.get_table_data()
+            self.assertEqual(
+                view.terms, {"submit_time": "submit_time within %s hours" % value}
+            )
+            self.assertEqual(str(data.query), str(view.get_queryset().query))
+
+
 class TestForDeviceTable(TestCase):
     """
     Device table tests using LavaTable and LavaView
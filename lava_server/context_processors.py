@@ -17,10 +17,17 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with LAVA.  If not, see <http://www.gnu.org/licenses/>.
 
+import functools
+
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 
-def lava(request):
+@functools.lru_cache(maxsize=None)
+def _lava_context():
+    # The settings do not change while the process runs, so build the
+    # branding context only once
     return {
         "lava": {
             "instance_name": settings.INSTANCE_NAME,
@@ -37,9 +44,24 @@ def lava(request):
     }
 
 
-def ldap_available(request):
+@functools.lru_cache(maxsize=None)
+def _ldap_context():
     ldap_enabled = (
         "django_auth_ldap.backend.LDAPBackend" in settings.AUTHENTICATION_BACKENDS
     )
     login_message_ldap = getattr(settings, "LOGIN_MESSAGE_LDAP", "")
     return {"ldap_available": ldap_enabled, "login_message_ldap": login_message_ldap}
+
+
+@receiver(setting_changed)
+def _clear_contexts(**kwargs):
+    _lava_context.cache_clear()
+    _ldap_context.cache_clear()
+
+
+def lava(request):
+    return _lava_context()
+
+
+def ldap_available(request):
+    return _ldap_context()
@@ -20,27 +20,36 @@
 
 # Created with Django 1.8.18
 
-import contextlib
-import imp
+from types import MappingProxyType
+
+from django.utils.functional import SimpleLazyObject
 
 # Import application settings
-from lava_scheduler_app.settings import *
-from lava_rest_app.versions import versions as REST_VERSIONS
+from lava_scheduler_app.settings import (
+    EVENT_ADDITIONAL_SOCKETS,
+    EVENT_NOTIFICATION,
+    EVENT_SOCKET,
+    EVENT_TOPIC,
+    INTERNAL_EVENT_SOCKET,
+)
 
 
 # List of people who get code error notifications
 # https://docs.djangoproject.com/en/1.8/ref/settings/#admins
-ADMINS = [["lava-server Administrator", "root@localhost"]]
+ADMINS = (("lava-server Administrator", "root@localhost"),)
 # List of people who get broken link notifications
 # https://docs.djangoproject.com/en/1.8/ref/settings/#managers
 MANAGERS = ADMINS
 
+# Debugging is enabled by the development settings only
+DEBUG = False
+
 # Allow only the connection through the reverse proxy
-ALLOWED_HOSTS = ["[::1]", "127.0.0.1", "localhost"]
+ALLOWED_HOSTS = ("[::1]", "127.0.0.1", "localhost")
 INTERNAL_IPS = []
 
 # Application definition
-INSTALLED_APPS = [
+INSTALLED_APPS = (
     # Add LAVA applications
     "lava_server",
     "lava_results_app",
@@ -60,10 +69,10 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.humanize",
-    "django.contrib.sites",  # FIXME: should not be needed anymore
-]
+    "django.contrib.sites",  # domain used in job and notification urls
+)
 
-MIDDLEWARE = [
+MIDDLEWARE = (
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -71,7 +80,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-]
+)
 
 ROOT_URLCONF = "lava_server.urls"
 
@@ -81,7 +90,8 @@ TEMPLATES = [
         "DIRS": [],
         "APP_DIRS": True,
         "OPTIONS": {
-            "context_processors": [
+            "debug": False,
+            "context_processors": (
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
@@ -91,7 +101,7 @@ TEMPLATES = [
                 # LAVA context processors
                 "lava_server.context_processors.lava",
                 "lava_server.context_processors.ldap_available",
-            ]
+            ),
         },
     }
 ]
@@ -105,9 +115,10 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "UTC"
 
-USE_I18N = True
+# The interface is only available in English
+USE_I18N = False
 
-USE_L10N = True
+USE_L10N = False
 
 USE_TZ = True
 
@@ -138,29 +149,34 @@ TESTCASE_COUNT_LIMIT = 10000
 # Default URL after login
 LOGIN_REDIRECT_URL = "/"
 
+
+def _discover_optional_apps(names):
+    import importlib.util
+
+    return tuple(name for name in names if importlib.util.find_spec(name) is not None)
+
+
 # Automatically install some applications
-for module_name in ["devserver", "django_extensions", "django_openid_auth", "hijack"]:
-    with contextlib.suppress(ImportError):
-        imp.find_module(module_name)
-        INSTALLED_APPS.append(module_name)
+INSTALLED_APPS += _discover_optional_apps(
+    ("devserver", "django_extensions", "django_openid_auth", "hijack")
+)
 
 # General URL prefix
 MOUNT_POINT = ""
 
 # Do not disallow any user-agent yet
-DISALLOWED_USER_AGENTS = []
+DISALLOWED_USER_AGENTS = ()
 
-# Set a site ID
-# FIXME: should not be needed
+# Set a site ID, Site.objects.get_current() caches the lookup
 SITE_ID = 1
 
 # Django System check framework settings for security.* checks.
 # Silence some checks that should be explicitly configured by administrators
 # on need basis.
-SILENCED_SYSTEM_CHECKS = [
+SILENCED_SYSTEM_CHECKS = (
     "security.W004",  # silence SECURE_HSTS_SECONDS
     "security.W008",  # silence SECURE_SSL_REDIRECT
-]
+)
 SECURE_CONTENT_TYPE_NOSNIFF = True
 SECURE_BROWSER_XSS_FILTER = True
 SESSION_COOKIE_SECURE = True
@@ -207,29 +223,39 @@ ALLOW_ADMIN_DELETE = True
 # Default callback http timeout in seconds
 CALLBACK_TIMEOUT = 5
 
+
+def _rest_versions():
+    from lava_rest_app.versions import versions
+
+    return versions
+
+
 # DRF may need this to be true when used in some instances.
 USE_X_FORWARDED_HOST = False
-REST_FRAMEWORK = {
-    "DEFAULT_PERMISSION_CLASSES": [
-        "rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly"
-    ],
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
-    "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
-    "ALLOWED_VERSIONS": REST_VERSIONS,
-    "DEFAULT_FILTER_BACKENDS": (
-        "rest_framework_filters.backends.DjangoFilterBackend",
-        "rest_framework.filters.OrderingFilter",
-        "rest_framework.filters.SearchFilter",
-    ),
-    "PAGE_SIZE": 50,
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.SessionAuthentication",
-        "lava_rest_app.authentication.LavaTokenAuthentication",
-    ),
-}
+REST_FRAMEWORK = MappingProxyType(
+    {
+        "DEFAULT_PERMISSION_CLASSES": (
+            "rest_framework.permissions.DjangoModelPermissionsOrAnonReadOnly",
+        ),
+        "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.LimitOffsetPagination",
+        "DEFAULT_VERSIONING_CLASS": "rest_framework.versioning.URLPathVersioning",
+        # Only read when negotiating the version of an API request
+        "ALLOWED_VERSIONS": SimpleLazyObject(_rest_versions),
+        "DEFAULT_FILTER_BACKENDS": (
+            "rest_framework_filters.backends.DjangoFilterBackend",
+            "rest_framework.filters.OrderingFilter",
+            "rest_framework.filters.SearchFilter",
+        ),
+        "PAGE_SIZE": 50,
+        "DEFAULT_AUTHENTICATION_CLASSES": (
+            "rest_framework.authentication.SessionAuthentication",
+            "lava_rest_app.authentication.LavaTokenAuthentication",
+        ),
+    }
+)
 
 # Extra context variables when validating the job definition schema
-EXTRA_CONTEXT_VARIABLES = []
+EXTRA_CONTEXT_VARIABLES = frozenset()
 
 # Default length value for all tables
 DEFAULT_TABLE_LENGTH = 25
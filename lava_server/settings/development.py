@@ -17,7 +17,6 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with LAVA.  If not, see <http://www.gnu.org/licenses/>.
 
-import contextlib
 import os
 
 # pylint: disable=unused-import,unused-wildcard-import,wildcard-import
@@ -76,15 +75,7 @@ STATIC_ROOT = os.path.join(PROJECT_STATE_DIR, "static")
 # Make this unique, and don't share it with anybody.
 SECRET_KEY = "00000000000000000000000000000000000000000000000000"
 
-# Try using devserver if available, devserver is a very useful extension that
-# makes debugging applications easier. It shows a lot of interesting output,
-# like SQL queries and timings for each request. It also supports
-# multi-threaded or multi-process server so some degree of parallelism can be
-# achieved.
-with contextlib.suppress(ImportError):
-    import devserver
-
-    INSTALLED_APPS += ["devserver"]
+# devserver is added by the common settings when it's available
 
 USE_DEBUG_TOOLBAR = False
 
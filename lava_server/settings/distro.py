@@ -47,8 +47,8 @@ MOUNT_POINT = (MOUNT_POINT.rstrip("/") + "/").lstrip("/")
 # Fix ADMINS and MANAGERS variables
 # In Django >= 1.9 this is a list of tuples
 # and https://docs.djangoproject.com/en/1.9/ref/settings/#admins
-ADMINS = [tuple(v) for v in ADMINS]
-MANAGERS = [tuple(v) for v in MANAGERS]
+ADMINS = tuple(tuple(v) for v in ADMINS)
+MANAGERS = tuple(tuple(v) for v in MANAGERS)
 
 # Load default database from distro integration
 config = ConfigFile.load("/etc/lava-server/instance.conf")
@@ -60,6 +60,9 @@ DATABASES = {
         "PASSWORD": getattr(config, "LAVA_DB_PASSWORD", ""),
         "HOST": getattr(config, "LAVA_DB_SERVER", "127.0.0.1"),
         "PORT": getattr(config, "LAVA_DB_PORT", ""),
+        # Keep the connections open between requests
+        "CONN_MAX_AGE": 60,
+        "OPTIONS": {"connect_timeout": 5},
     }
 }
 
@@ -68,8 +71,7 @@ SECRET_KEY = get_secret_key("/etc/lava-server/secret_key.conf")
 
 # LDAP authentication config
 if AUTH_LDAP_SERVER_URI:
-    INSTALLED_APPS.append("ldap")
-    INSTALLED_APPS.append("django_auth_ldap")
+    INSTALLED_APPS += ("ldap", "django_auth_ldap")
     import ldap
     from django_auth_ldap.config import LDAPSearch, LDAPSearchUnion
 
@@ -112,20 +114,35 @@ if AUTH_LDAP_SERVER_URI:
             AUTH_LDAP_GROUP_TYPE = eval(group_type)
 
 elif AUTH_DEBIAN_SSO:
-    MIDDLEWARE.append("lava_server.debian_sso.DebianSsoUserMiddleware")
+    MIDDLEWARE += ("lava_server.debian_sso.DebianSsoUserMiddleware",)
     AUTHENTICATION_BACKENDS.append("lava_server.debian_sso.DebianSsoUserBackend")
 
 if USE_DEBUG_TOOLBAR:
-    INSTALLED_APPS.append("debug_toolbar")
-    MIDDLEWARE = ["debug_toolbar.middleware.DebugToolbarMiddleware"] + MIDDLEWARE
+    INSTALLED_APPS += ("debug_toolbar",)
+    MIDDLEWARE = ("debug_toolbar.middleware.DebugToolbarMiddleware",) + tuple(
+        MIDDLEWARE
+    )
     INTERNAL_IPS.extend(["127.0.0.1", "::1"])
 
 # List of compiled regular expression objects representing User-Agent strings
 # that are not allowed to visit any page, systemwide. Use this for bad
 # robots/crawlers
-DISALLOWED_USER_AGENTS = [
+DISALLOWED_USER_AGENTS = tuple(
     re.compile(r"%s" % reg, re.IGNORECASE) for reg in DISALLOWED_USER_AGENTS
-]
+)
+# Merge the patterns into a single regular expression so that each request is
+# matched only once. Patterns with inline flags, which must start the
+# expression, or with groups, which would be renumbered, are kept apart.
+if len(DISALLOWED_USER_AGENTS) > 1 and not any(
+    regex.groups or re.search(r"\(\?[aiLmsux-]+[:)]", regex.pattern)
+    for regex in DISALLOWED_USER_AGENTS
+):
+    DISALLOWED_USER_AGENTS = (
+        re.compile(
+            "|".join("(?:%s)" % regex.pattern for regex in DISALLOWED_USER_AGENTS),
+            re.IGNORECASE,
+        ),
+    )
 
 # Set instance name
 if os.path.exists("/etc/lava-server/instance.conf"):
@@ -134,6 +151,15 @@ if os.path.exists("/etc/lava-server/instance.conf"):
 
 INSTANCE_NAME = globals().get("INSTANCE_NAME", instance_name)
 
+# Read the sessions from the cache when it's shared by all the processes,
+# like memcached configured in settings.conf. With a per-process cache, a
+# session deleted by one process would still be valid in the others.
+if "SESSION_ENGINE" not in globals() and CACHES["default"]["BACKEND"] not in [
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+]:
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
+
 # Logging
 LOGGING = {
     "version": 1,